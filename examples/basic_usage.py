@@ -7,9 +7,14 @@ for analyzing causality between two time series.
 """
 
 import numpy as np
-import scipy.io
 import matplotlib.pyplot as plt
-from mbvlgranger import quick_mbvlgranger, mbvl_granger, print_mbvlgranger_results
+from mbvlgranger import (quick_mbvlgranger, mbvl_granger, mbvl_granger_combine,
+                         print_mbvlgranger_results)
+from mbvlgranger.data_generation import load_gasfurnace
+from mbvlgranger.utils import lagged_linear
+
+# One independent, reproducible random stream per example
+SEED_STREAMS = np.random.SeedSequence(42).spawn(4)
 
 def example_1_simple_analysis():
     """Example 1: Ultra-simple one-liner analysis"""
@@ -18,18 +23,13 @@ def example_1_simple_analysis():
     print("=" * 60)
     
     # Generate synthetic data with known causality
-    np.random.seed(42)
+    rng = np.random.default_rng(SEED_STREAMS[0])
     n = 1000
-    x = np.random.randn(n)
-    y = np.zeros(n)
+    x = rng.standard_normal(n)
     
     # Create causality: y[t] = 0.8 * x[t-10] + noise
     lag = 10
-    for t in range(n):
-        if t >= lag:
-            y[t] = 0.8 * x[t - lag] + 0.3 * np.random.randn()
-        else:
-            y[t] = 0.3 * np.random.randn()
+    y = lagged_linear(x, lag, 0.8, 0.3 * rng.standard_normal(n))
     
     # One-liner analysis
     results = quick_mbvlgranger(x, y, fs=250, max_lag=30)
@@ -46,36 +46,27 @@ def example_2_custom_frequency_bands():
     
     # Load real-world data (you'll need to have this file)
     try:
-        mat_data = scipy.io.loadmat('data/gasfurnace.mat')
-        x = np.array(mat_data['gasfurnace'][0]).flatten()
-        y = np.array(mat_data['gasfurnace'][1]).flatten()
+        x, y = load_gasfurnace('data/gasfurnace.mat')
         
         print(f"Loaded gas furnace data: {len(x)} samples")
         
     except FileNotFoundError:
         print("Gas furnace data not found, generating synthetic process data...")
         # Generate synthetic process control data
-        np.random.seed(123)
+        rng = np.random.default_rng(SEED_STREAMS[1])
         n = 500
         t = np.linspace(0, 100, n)
         
-        # Simulate process with multiple time scales
-        x = (np.sin(0.1 * t) +           # Slow dynamics
-             0.5 * np.sin(0.5 * t) +     # Medium dynamics  
-             0.3 * np.sin(2.0 * t) +     # Fast dynamics
-             0.2 * np.random.randn(n))   # Noise
+        # Simulate process with multiple time scales (slow, medium, fast),
+        # evaluating all components in one pass over t
+        omegas = np.array([[0.1], [0.5], [2.0]])
+        amplitudes = np.array([1.0, 0.5, 0.3])
+        x = amplitudes @ np.sin(omegas * t) + 0.2 * rng.standard_normal(n)
         
         # Y responds to X with different lags at different frequencies
-        y = np.zeros(n)
-        for i in range(n):
-            # Slow response (lag 20)
-            if i >= 20:
-                y[i] += 0.6 * x[i-20]
-            # Fast response (lag 5)  
-            if i >= 5:
-                y[i] += 0.3 * x[i-5]
-            # Add noise
-            y[i] += 0.2 * np.random.randn()
+        y = 0.2 * rng.standard_normal(n)
+        y = lagged_linear(x, 20, 0.6, y)    # Slow response (lag 20)
+        y = lagged_linear(x, 5, 0.3, y)     # Fast response (lag 5)
     
     # Define frequency bands for process control
     process_bands = {
@@ -104,32 +95,25 @@ def example_3_eeg_analysis():
     print("=" * 60)
     
     # Generate synthetic EEG-like data
-    np.random.seed(456)
+    rng = np.random.default_rng(SEED_STREAMS[2])
     fs = 500  # 500 Hz sampling
     duration = 10  # 10 seconds
     n = fs * duration
     t = np.linspace(0, duration, n)
     
     # Create multi-frequency signals
-    # Channel X: mixed frequency content
-    x = (0.8 * np.sin(2 * np.pi * 10 * t) +    # Alpha (10 Hz)
-         0.6 * np.sin(2 * np.pi * 40 * t) +    # Gamma (40 Hz)
-         0.4 * np.random.randn(n))              # Noise
+    # Channel X: mixed frequency content, alpha (10 Hz) and gamma (40 Hz)
+    omegas = 2 * np.pi * np.array([[10], [40]])
+    amplitudes = np.array([0.8, 0.6])
+    x = amplitudes @ np.sin(omegas * t) + 0.4 * rng.standard_normal(n)
     
     # Channel Y: responds to X with frequency-specific lags
-    y = np.zeros(n)
     alpha_lag = 25    # 50ms lag for alpha (25 samples at 500Hz)
     gamma_lag = 10    # 20ms lag for gamma (10 samples at 500Hz)
     
-    for i in range(n):
-        # Alpha coupling
-        if i >= alpha_lag:
-            y[i] += 0.5 * x[i - alpha_lag]
-        # Gamma coupling  
-        if i >= gamma_lag:
-            y[i] += 0.3 * x[i - gamma_lag]
-        # Noise
-        y[i] += 0.3 * np.random.randn()
+    y = 0.3 * rng.standard_normal(n)
+    y = lagged_linear(x, alpha_lag, 0.5, y)    # Alpha coupling
+    y = lagged_linear(x, gamma_lag, 0.3, y)    # Gamma coupling
     
     # Standard EEG frequency bands
     eeg_bands = {
@@ -170,34 +154,31 @@ def example_4_comparison_methods():
     print("=" * 60)
     
     # Generate test data
-    np.random.seed(789)
+    rng = np.random.default_rng(SEED_STREAMS[3])
     n = 800
-    x = np.random.randn(n)
-    y = np.zeros(n)
+    x = rng.standard_normal(n)
     
     # Add causality in specific frequency bands
     lag = 15
-    for t in range(n):
-        if t >= lag:
-            y[t] = 0.7 * x[t - lag] + 0.25 * np.random.randn()
-        else:
-            y[t] = 0.25 * np.random.randn()
+    y = lagged_linear(x, lag, 0.7, 0.25 * rng.standard_normal(n))
+    
+    # Run the band analysis once, without combining p-values
+    band_analysis = mbvl_granger(
+        X=x, Y=y,
+        fs=250,
+        max_lag=25,
+        combination_method=None,
+        alpha=0.05,
+        gamma=0.4
+    )
     
-    # Compare different combination methods
+    # Compare different combination methods on the same band p-values
     methods = ['fisher', 'stouffer', 'bonferroni']
     
     for method in methods:
         print(f"\n--- {method.upper()} METHOD ---")
         
-        results = mbvl_granger(
-            X=x, Y=y,
-            fs=250,
-            max_lag=25,
-            combination_method=method,
-            alpha=0.05,
-            gamma=0.4,
-            print_results=False  # Suppress detailed output
-        )
+        results = mbvl_granger_combine(band_analysis, method)
         
         print(f"Overall Causality: {results['overall_causality']}")
         print(f"Combined p-value: {results['combined_p_value']:.6f}")
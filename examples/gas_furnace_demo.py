@@ -4,8 +4,9 @@ Gas Furnace Demo - Reproducing your exact workflow
 """
 
 import numpy as np
-import scipy.io
 from mbvlgranger import quick_mbvlgranger
+from mbvlgranger.data_generation import load_gasfurnace
+from mbvlgranger.utils import lagged_linear
 
 def main():
     """Reproduce your exact gas furnace analysis"""
@@ -14,31 +15,23 @@ def main():
     
     # Load the data (you'll need to provide this file)
     try:
-        mat_data = scipy.io.loadmat('data/gasfurnace.mat')
+        x, y = load_gasfurnace('data/gasfurnace.mat')
         print("✅ Loaded gasfurnace.mat successfully")
         
-        x = np.array(mat_data['gasfurnace'][0]).flatten()
-        y = np.array(mat_data['gasfurnace'][1]).flatten()
-        
         print(f"Data shape: X={x.shape}, Y={y.shape}")
         
     except FileNotFoundError:
         print("❌ gasfurnace.mat not found. Generating synthetic data...")
         # Generate synthetic furnace-like data
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n = 296  # Typical gas furnace dataset size
         t = np.linspace(0, 300, n)
         
         # Simulate furnace input (gas rate)
-        x = np.sin(0.05 * t) + 0.3 * np.random.randn(n)
+        x = np.sin(0.05 * t) + 0.3 * rng.standard_normal(n)
         
-        # Simulate furnace output (CO2 concentration) with delay
-        y = np.zeros(n)
-        for i in range(n):
-            if i >= 4:  # 4-sample delay
-                y[i] = 0.7 * x[i-4] + 0.2 * np.random.randn()
-            else:
-                y[i] = 0.2 * np.random.randn()
+        # Simulate furnace output (CO2 concentration) with 4-sample delay
+        y = lagged_linear(x, 4, 0.7, 0.2 * rng.standard_normal(n))
     
     # Your exact analysis
     results = quick_mbvlgranger(
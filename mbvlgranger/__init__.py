@@ -12,11 +12,13 @@ Main Functions:
 - vlf_granger: Convenient frequency-band analysis
 - quick_vlgranger: Ultra-simple one-liner analysis
 - print_vlgranger_results: Pretty-print results
+- mbvl_granger_combine: Re-combine band p-values with another method
 """
 
 from .core import VLGrangerCausality, vl_granger_causality
 from .frequency_analysis import MultiBandVLGranger, multiband_vl_granger_analysis
-from .statistical_tests import mbvl_granger, quick_mbvlgranger, print_mbvlgranger_results
+from .statistical_tests import (mbvl_granger, mbvl_granger_combine, quick_mbvlgranger,
+                                print_mbvlgranger_results)
 from .data_generation import generate_complete_dataset, load_dataset_file
 from .evaluation import run_comprehensive_test
 
@@ -42,6 +44,7 @@ __all__ = [
     
     # Main analysis functions
     'mbvl_granger',
+    'mbvl_granger_combine',
     'quick_mbvlgranger',
     'vl_granger_causality',
     'multiband_vl_granger_analysis',
@@ -493,6 +493,34 @@ def load_dataset_file(filepath):
         print(f"Error loading {filepath}: {e}")
         return None
 
+def load_gasfurnace(filepath="data/gasfurnace.mat"):
+    """
+    Load the gas furnace input/output series as (x, y)
+    
+    The MATLAB file is parsed once and cached next to it as a .npz file,
+    which later calls read directly. Raises FileNotFoundError if neither
+    the cache nor the .mat file exists.
+    """
+    mat_path = Path(filepath)
+    cache_path = mat_path.with_suffix(".npz")
+    
+    # Use the cache unless the .mat file has been updated since
+    if cache_path.exists() and (not mat_path.exists() or
+                                cache_path.stat().st_mtime >= mat_path.stat().st_mtime):
+        with np.load(cache_path) as cached:
+            return cached['x'], cached['y']
+    
+    mat_data = scipy.io.loadmat(str(mat_path))
+    x = np.array(mat_data['gasfurnace'][0]).flatten()
+    y = np.array(mat_data['gasfurnace'][1]).flatten()
+    
+    try:
+        np.savez(cache_path, x=x, y=y)
+    except OSError:
+        pass  # Read-only data directory: just skip caching
+    
+    return x, y
+
 def quick_dataset_test():
     """
     Quick test to verify dataset generation works including AR noise
@@ -104,6 +104,39 @@ def bonferroni_combination(p_values):
     return combined_p, min_p
 
 
+def combine_pvalues(p_values, combination_method='fisher'):
+    """
+    Combine band-level p-values into a single overall p-value
+    
+    Parameters:
+    -----------
+    p_values : array-like
+        Band-level p-values
+    combination_method : str
+        Method to combine p-values ('fisher', 'stouffer', 'bonferroni')
+        
+    Returns:
+    --------
+    Tuple[float, float]
+        Combined p-value, method-specific test statistic
+    """
+    p_values = np.asarray(p_values, dtype=float)
+    
+    if combination_method == 'fisher':
+        combine = fishers_combined_test
+    elif combination_method == 'stouffer':
+        combine = stouffers_method
+    elif combination_method == 'bonferroni':
+        combine = bonferroni_combination
+    else:
+        raise ValueError("combination_method must be 'fisher', 'stouffer', or 'bonferroni'")
+    
+    if len(p_values) == 0:
+        return 1.0, 0.0
+    
+    return combine(p_values)
+
+
 def estimate_noise_characteristics(X, Y):
     """
     Estimate noise level in the signals
@@ -414,7 +447,7 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
                bands: Optional[Dict[str, Tuple[float, float]]] = None,
                alpha: float = 0.05,
                gamma: float = 0.2,
-               combination_method: str = 'fisher',
+               combination_method: Optional[str] = 'fisher',
                adaptive_lag: bool = False,
                pcmci_alpha: float = 0.05,
                fallback_max_lag: int = 15,
@@ -437,8 +470,11 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
         Significance level
     gamma : float
         BIC ratio threshold  
-    combination_method : str
-        Method to combine p-values ('fisher', 'stouffer', 'bonferroni')
+    combination_method : str or None
+        Method to combine p-values ('fisher', 'stouffer', 'bonferroni').
+        None skips the combination (and the noise-aware broadband
+        shortcut) so band-level p-values are always returned; combine them
+        later with mbvl_granger_combine
     adaptive_lag : bool
         Whether to use adaptive lag selection
     pcmci_alpha : float
@@ -465,6 +501,10 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
             method_used = 'frequency_bands_noisy'
             # Continue with existing frequency band analysis below...
             
+        elif combination_method is None:
+            # Band-level results requested: skip the broadband shortcut
+            method_used = 'frequency_bands_only'
+            
         else:
             # Low noise: try broadband VL-Granger first
             broadband_result = broadband_vl_granger_with_strict_mode(X, Y, fs, max_lag or 25, strict_mode=False)
@@ -479,6 +519,8 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
                     'bic_ratio': broadband_result['bic_ratio'],
                     'noise_level': noise_level,
                     'band_results': pd.DataFrame(),  # Empty for compatibility
+                    'combination_method': 'broadband',  # No band p-values were combined
+                    'n_valid_bands': 0,
                     'adaptive_lags_used': {'broadband': max_lag or 25}
                 }
             else:
@@ -498,7 +540,7 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
         }
     
     analyzer = MultiBandVLGranger()
-    results = []
+    band_rows = []
     p_values = []
     adaptive_lags_used = {}  # Track what lags were selected for each band
     count_significant = 0
@@ -540,7 +582,7 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
                 count_significant += 1
             
             interval = f"{freq_range[0]}-{freq_range[1]}Hz"
-            results.append({
+            band_rows.append({
                 'interval': interval,
                 'f_stat': result['f_statistic'],
                 'p_value': p_val,
@@ -559,7 +601,7 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
             interval = f"{freq_range[0]}-{freq_range[1]}Hz"
             fallback_lag = fallback_max_lag if not adaptive_lag or max_lag is None else max_lag
             
-            results.append({
+            band_rows.append({
                 'interval': interval,
                 'f_stat': np.nan,
                 'p_value': np.nan,
@@ -573,39 +615,77 @@ def mbvl_granger(X: np.ndarray, Y: np.ndarray, fs: float,
             warnings.warn(f"Error processing band {band_name}: {str(e)}")
     
     # Create DataFrame
-    band_results = pd.DataFrame(results)
+    band_results = pd.DataFrame(band_rows)
     
-    # COMBINE P-VALUES for overall causality
-    if len(p_values) > 0:
-        p_values_array = np.array(p_values)
-        if combination_method == 'fisher':
-            combined_p_value, test_statistic = fishers_combined_test(p_values_array)
-        elif combination_method == 'stouffer':
-            combined_p_value, test_statistic = stouffers_method(p_values_array)
-        elif combination_method == 'bonferroni':
-            combined_p_value, test_statistic = bonferroni_combination(p_values_array)
-        else:
-            raise ValueError("combination_method must be 'fisher', 'stouffer', or 'bonferroni'")
-    else:
-        combined_p_value = 1.0
-        test_statistic = 0.0
-    
-    # Overall causality decision
-    overall_causality = combined_p_value <= alpha
-    
-    return {
+    results = {
         'band_results': band_results,
-        'overall_causality': overall_causality,
-        'combined_p_value': combined_p_value,
-        'test_statistic': test_statistic,
-        'combination_method': combination_method,
+        'overall_causality': None,
+        'combined_p_value': np.nan,
+        'test_statistic': np.nan,
+        'combination_method': None,
         'individual_p_values': p_values,
         'n_valid_bands': len(p_values),
+        'alpha': alpha,
         'adaptive_lags_used': adaptive_lags_used,  # New: shows what lags were selected
         'adaptive_lag_enabled': adaptive_lag,       # New: indicates if adaptive mode was used
         'noise_level': noise_level,          # NEW
         'method_used': method_used
     }
+    
+    # COMBINE P-VALUES for overall causality
+    if combination_method is not None:
+        results = mbvl_granger_combine(results, combination_method)
+    
+    return results
+
+
+def mbvl_granger_combine(results: Dict, combination_method: str = 'fisher',
+                         alpha: Optional[float] = None) -> Dict:
+    """
+    Combine the band-level p-values of an mbvl_granger result
+    
+    Lets several combination methods be compared on one band decomposition
+    without repeating the filtering and per-band VL-Granger regressions.
+    Run mbvl_granger with combination_method=None to get such a result.
+    Broadband early-return results (combination_method 'broadband') have no
+    band p-values; they are returned unchanged with a warning.
+    
+    Parameters:
+    -----------
+    results : dict
+        Results from mbvl_granger (any combination_method, including None)
+    combination_method : str
+        Method to combine p-values ('fisher', 'stouffer', 'bonferroni')
+    alpha : float, optional
+        Significance level; defaults to the one used by mbvl_granger
+        
+    Returns:
+    --------
+    Dict
+        Copy of results with the overall causality fields recomputed
+    """
+    combined = dict(results)
+    
+    # Broadband early-return results have no band-level p-values to combine
+    if 'individual_p_values' not in results:
+        warnings.warn(f"Cannot apply '{combination_method}' to a broadband result without "
+                      "band p-values; run mbvl_granger with combination_method=None")
+        return combined
+    
+    if alpha is None:
+        alpha = results.get('alpha', 0.05)
+    
+    combined_p_value, test_statistic = combine_pvalues(results['individual_p_values'],
+                                                       combination_method)
+    
+    combined.update({
+        'overall_causality': combined_p_value <= alpha,
+        'combined_p_value': combined_p_value,
+        'test_statistic': test_statistic,
+        'combination_method': combination_method,
+        'alpha': alpha
+    })
+    return combined
 
 
 def print_mbvlgranger_results(results):
@@ -84,4 +84,42 @@ def format_frequency_bands(bands: dict) -> dict:
         
         formatted_bands[name] = (float(low), float(high))
     
-    return formatted_bands
\ No newline at end of file
+    return formatted_bands
+
+def lagged_linear(x: np.ndarray, lag: int, coeff: float, noise: np.ndarray) -> np.ndarray:
+    """
+    Build a lagged linear response y[t] = coeff * x[t - lag] + noise[t]
+    
+    Samples with t < lag carry only the noise term. Responses with several
+    lags can be superposed by passing a previous result as ``noise``.
+    
+    Parameters:
+    -----------
+    x : np.ndarray
+        Driving (source) time series
+    lag : int
+        Delay in samples (non-negative)
+    coeff : float
+        Coupling coefficient
+    noise : np.ndarray
+        Additive term, same length as x (not modified)
+        
+    Returns:
+    --------
+    np.ndarray
+        Response time series
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.array(noise, dtype=float)
+    
+    if len(x) != len(y):
+        raise ValueError("x and noise must have the same length")
+    if lag < 0:
+        raise ValueError("lag must be non-negative")
+    
+    if lag == 0:
+        y += coeff * x
+    elif lag < len(x):
+        y[lag:] += coeff * x[:-lag]
+    
+    return y
@@ -6,10 +6,19 @@ This script tests all major components to ensure the package works correctly
 after renaming from vlgranger to mbvlgranger.
 """
 
+import io
+import os
 import sys
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import traceback
 
+# Independent, reproducible random streams for the checks that run in
+# parallel worker processes (one child SeedSequence per check)
+SEED_STREAMS = np.random.SeedSequence(42).spawn(4)
+
 def test_imports():
     """Test all import statements"""
     print("🔍 Testing Imports...")
@@ -52,20 +61,16 @@ def test_core_functionality():
     
     try:
         from mbvlgranger import VLGrangerCausality
+        from mbvlgranger.utils import lagged_linear
         
         # Generate simple test data
-        np.random.seed(42)
+        rng = np.random.default_rng(SEED_STREAMS[0])
         n = 200
-        x = np.random.randn(n)
-        y = np.zeros(n)
+        x = rng.standard_normal(n)
         
         # Create causality: y[t] = 0.8 * x[t-5] + noise
         lag = 5
-        for t in range(n):
-            if t >= lag:
-                y[t] = 0.8 * x[t - lag] + 0.2 * np.random.randn()
-            else:
-                y[t] = 0.2 * np.random.randn()
+        y = lagged_linear(x, lag, 0.8, 0.2 * rng.standard_normal(n))
         
         # Test analysis
         analyzer = VLGrangerCausality()
@@ -97,10 +102,10 @@ def test_main_functions():
         from mbvlgranger import mbvl_granger, quick_mbvlgranger, print_mbvlgranger_results
         
         # Generate test data
-        np.random.seed(123)
+        rng = np.random.default_rng(SEED_STREAMS[1])
         n = 300
-        x = np.random.randn(n)
-        y = 0.6 * x + 0.4 * np.random.randn(n)  # Instantaneous causality
+        x = rng.standard_normal(n)
+        y = 0.6 * x + 0.4 * rng.standard_normal(n)  # Instantaneous causality
         
         # Test mbvl_granger
         result1 = mbvl_granger(x, y, fs=250, max_lag=20)
@@ -131,16 +136,15 @@ def test_multiband_class():
         from mbvlgranger import MultiBandVLGranger
         
         # Generate test data with multiple frequencies
-        np.random.seed(456)
+        rng = np.random.default_rng(SEED_STREAMS[2])
         fs = 500
         t = np.linspace(0, 4, fs * 4)
         
-        # Multi-frequency signal
-        x = (np.sin(2 * np.pi * 10 * t) +    # 10 Hz
-             np.sin(2 * np.pi * 40 * t) +    # 40 Hz  
-             0.3 * np.random.randn(len(t)))
+        # Multi-frequency signal: 10 Hz + 40 Hz
+        omegas = 2 * np.pi * np.array([[10], [40]])
+        x = np.sin(omegas * t).sum(axis=0) + 0.3 * rng.standard_normal(len(t))
         
-        y = 0.5 * x + 0.3 * np.random.randn(len(t))
+        y = 0.5 * x + 0.3 * rng.standard_normal(len(t))
         
         # Test single band analysis
         analyzer = MultiBandVLGranger()
@@ -168,19 +172,15 @@ def test_your_exact_usage():
     
     try:
         from mbvlgranger import quick_mbvlgranger
+        from mbvlgranger.utils import lagged_linear
         
         # Simulate your gas furnace data
-        np.random.seed(789)
+        rng = np.random.default_rng(SEED_STREAMS[3])
         n = 296
-        x = np.random.randn(n)
-        y = np.zeros(n)
+        x = rng.standard_normal(n)
         
-        # Add some causality
-        for i in range(n):
-            if i >= 4:
-                y[i] = 0.7 * x[i-4] + 0.3 * np.random.randn()
-            else:
-                y[i] = 0.3 * np.random.randn()
+        # Add lag-4 causality, strong enough to be reliably detected
+        y = lagged_linear(x, 4, 0.9, 0.2 * rng.standard_normal(n))
         
         # Your exact usage
         results = quick_mbvlgranger(
@@ -196,6 +196,9 @@ def test_your_exact_usage():
             print_results=False  # Suppress output for test
         )
         
+        if not results['overall_causality']:
+            raise ValueError("Planted lag-4 causality was not detected")
+        
         print("  ✅ Your exact usage pattern works!")
         print(f"  📊 Overall causality: {results['overall_causality']}")
         print(f"  📊 Combined p-value: {results['combined_p_value']:.6f}")
@@ -209,6 +212,17 @@ def test_your_exact_usage():
         print(f"  📍 Traceback: {traceback.format_exc()}")
         return False
 
+def warm_imports():
+    """Import the package (and the numpy/scipy/pandas/statsmodels modules it loads) once per worker"""
+    import mbvlgranger  # noqa: F401 (imported for its side effect)
+
+def run_buffered(test_func):
+    """Run a test with its output collected into one buffer"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        success = test_func()
+    return success, buffer.getvalue()
+
 def main():
     """Run all validation tests"""
     print("=" * 60)
@@ -223,13 +237,24 @@ def main():
         ("Your Exact Usage", test_your_exact_usage),
     ]
     
-    results = []
+    # Tests are independent, so run them in separate processes. Pin BLAS to a
+    # single thread per worker (set before the spawned workers import numpy)
+    # to avoid oversubscribing the cores.
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    max_workers = min(len(tests), os.cpu_count() or 1)
     
-    for test_name, test_func in tests:
-        print(f"\n🧪 Running: {test_name}")
-        print("-" * 40)
-        success = test_func()
-        results.append((test_name, success))
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=warm_imports) as executor:
+        futures = [(test_name, executor.submit(run_buffered, test_func))
+                   for test_name, test_func in tests]
+        
+        # Each worker buffers its own output; write it in declaration order
+        results = []
+        for test_name, future in futures:
+            success, output = future.result()
+            sys.stdout.write(f"\n🧪 Running: {test_name}\n{'-' * 40}\n{output}")
+            results.append((test_name, success))
     
     # Summary
     print("=" * 60)
@@ -5,42 +5,78 @@ Pre-PyPI Testing Suite
 Test everything before uploading to PyPI to avoid embarrassing failures!
 """
 
+import ast
+import hashlib
 import subprocess
 import sys
 import os
-import tempfile
 import shutil
+import tempfile
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a command and report results"""
+def run_command(argv, description, cwd=None):
+    """Run a command (argument list, no shell) and report results"""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
+        result = subprocess.run([str(arg) for arg in argv], capture_output=True, text=True,
+                                check=True, cwd=cwd)
         print(f"  ✅ Success: {description}")
         return True, result.stdout
     except subprocess.CalledProcessError as e:
         print(f"  ❌ Failed: {description}")
         print(f"  📍 Error: {e.stderr}")
         return False, e.stderr
+    except OSError as e:
+        # Executable not found or not runnable
+        print(f"  ❌ Failed: {description}")
+        print(f"  📍 Error: {e}")
+        return False, str(e)
+
+def source_tree_hash():
+    """Hash the files that determine the built distributions"""
+    # Every file in the package directory (modules and package-data such as
+    # data/*.mat), plus the packaging metadata. Files that only end up in the
+    # sdist via setuptools defaults (e.g. tests/) are not hashed.
+    files = sorted(path for path in Path("mbvlgranger").rglob("*")
+                   if path.is_file() and "__pycache__" not in path.parts)
+    files += [Path("pyproject.toml"), Path("setup.py"), Path("README.md"), Path("requirements.txt")]
+    
+    # blake2b is only a change detector here, not a security boundary
+    h = hashlib.blake2b()
+    for path in files:
+        if path.exists():
+            h.update(path.as_posix().encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
 
 def test_build_system():
     """Test that the package builds correctly"""
     print("\n📦 Testing Build System")
     print("-" * 40)
     
+    # Skip the rebuild when dist/ was built from the current sources
+    build_hash = source_tree_hash()
+    hash_file = Path("dist") / ".build-hash"
+    has_dists = any(Path("dist").glob("*.whl")) and any(Path("dist").glob("*.tar.gz"))
+    if has_dists and hash_file.exists() and hash_file.read_text().strip() == build_hash:
+        print("  ♻️  Sources unchanged since last build, reusing dist/")
+        return True
+    
     # Clean previous builds
     dirs_to_clean = ['build', 'dist', '*.egg-info']
     for pattern in dirs_to_clean:
-        run_command(f"rm -rf {pattern}", f"Cleaning {pattern}")
+        print(f"🔧 Cleaning {pattern}...")
+        for path in Path(".").glob(pattern):
+            shutil.rmtree(path, ignore_errors=True)
     
     # Test building
-    success, output = run_command("python -m build", "Building package with python -m build")
+    success, output = run_command([sys.executable, "-m", "build"],
+                                  "Building package with python -m build")
     if not success:
         return False
     
     # Check if files were created
-    dist_files = list(Path("dist").glob("*"))
+    dist_files = list(Path("dist").glob("*.whl")) + list(Path("dist").glob("*.tar.gz"))
     if len(dist_files) < 2:  # Should have .whl and .tar.gz
         print(f"  ❌ Expected 2 files in dist/, found {len(dist_files)}")
         return False
@@ -49,6 +85,7 @@ def test_build_system():
     for file in dist_files:
         print(f"    - {file.name}")
     
+    hash_file.write_text(build_hash)
     return True
 
 def test_package_metadata():
@@ -56,7 +93,8 @@ def test_package_metadata():
     print("\n📋 Testing Package Metadata")
     print("-" * 40)
     
-    success, output = run_command("twine check dist/*", "Checking package metadata")
+    dist_files = list(Path("dist").glob("*.whl")) + list(Path("dist").glob("*.tar.gz"))
+    success, output = run_command(["twine", "check", *dist_files], "Checking package metadata")
     return success
 
 def test_fresh_install():
@@ -68,46 +106,46 @@ def test_fresh_install():
     with tempfile.TemporaryDirectory() as temp_dir:
         venv_path = Path(temp_dir) / "test_venv"
         
-        # Create venv
-        success, _ = run_command(f"python -m venv {venv_path}", "Creating test virtual environment")
+        # Create venv without seeding pip into it (the slow part of venv creation)
+        success, _ = run_command([sys.executable, "-m", "venv", "--without-pip", venv_path],
+                                 "Creating test virtual environment")
         if not success:
             return False
         
-        # Get activation script
         if sys.platform == "win32":
-            activate_script = venv_path / "Scripts" / "activate.bat"
-            pip_cmd = f"{venv_path}/Scripts/pip"
+            python_cmd = venv_path / "Scripts" / "python"
         else:
-            activate_script = venv_path / "bin" / "activate"
-            pip_cmd = f"{venv_path}/bin/pip"
+            python_cmd = venv_path / "bin" / "python"
         
-        # Install from wheel
+        # Install from wheel with this interpreter's pip targeting the venv
+        # (pip >= 22.3); downloads come from pip's regular cache
         wheel_files = list(Path("dist").glob("*.whl"))
         if not wheel_files:
             print("  ❌ No wheel file found in dist/")
             return False
-            
+        
         wheel_file = wheel_files[0]
-        success, _ = run_command(f"{pip_cmd} install {wheel_file}", "Installing from wheel")
+        success, _ = run_command([sys.executable, "-m", "pip", "--python", python_cmd,
+                                  "install", wheel_file], "Installing from wheel")
         if not success:
             return False
         
         # Test import in fresh environment
-        python_cmd = f"{venv_path}/bin/python" if sys.platform != "win32" else f"{venv_path}/Scripts/python"
-        
         test_script = """
 import mbvlgranger
-from mbvlgranger import quick_mbvl_granger, MultiBandVLGranger
+from mbvlgranger import quick_mbvlgranger, MultiBandVLGranger
 import numpy as np
 
 # Quick functionality test  
 x = np.random.randn(100)
 y = np.random.randn(100)
-result = quick_mbvl_granger(x, y, fs=250, max_lag=10, print_results=False)
+result = quick_mbvlgranger(x, y, fs=250, max_lag=10, print_results=False)
 print("Package works in fresh environment!")
 """
         
-        success, _ = run_command(f'{python_cmd} -c "{test_script}"', "Testing package in fresh environment")
+        # Run outside the source tree so the installed wheel is imported, not ./mbvlgranger
+        success, _ = run_command([python_cmd, "-c", test_script], "Testing package in fresh environment",
+                                 cwd=temp_dir)
         return success
 
 def test_console_scripts():
@@ -116,7 +154,7 @@ def test_console_scripts():
     print("-" * 40)
     
     # Test if console script is accessible
-    success, output = run_command("mbvlgranger-test --help", "Testing console script")
+    success, output = run_command(["mbvlgranger-test", "--help"], "Testing console script")
     if not success:
         print("  ⚠️  Console script not found (this might be OK if not implemented)")
         return True  # Don't fail if console script isn't implemented
@@ -156,7 +194,8 @@ def test_dependencies():
     print("-" * 40)
     
     # Test installing dependencies
-    success, _ = run_command("pip install -e .", "Installing package with dependencies")
+    success, _ = run_command([sys.executable, "-m", "pip", "install", "-e", "."],
+                             "Installing package with dependencies")
     if not success:
         return False
     
@@ -172,7 +211,7 @@ import dtaidistance
 print("All dependencies importable!")
 """
     
-    success, _ = run_command(f'python -c "{deps_test}"', "Testing dependency imports")
+    success, _ = run_command([sys.executable, "-c", deps_test], "Testing dependency imports")
     return success
 
 def test_version_consistency():
@@ -180,41 +219,41 @@ def test_version_consistency():
     print("\n🔢 Testing Version Consistency")
     print("-" * 40)
     
-    # Check version in setup.py
+    # Check version in setup.py: the version= keyword of the setup() call
     setup_version = None
     try:
-        with open("setup.py", 'r') as f:
-            content = f.read()
-            # Look for version="..." pattern
-            import re
-            match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                setup_version = match.group(1)
-    except:
+        tree = ast.parse(Path("setup.py").read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "setup":
+                for keyword in node.keywords:
+                    if keyword.arg == "version" and isinstance(keyword.value, ast.Constant):
+                        setup_version = keyword.value.value
+    except (OSError, SyntaxError):
         pass
     
-    # Check version in pyproject.toml
+    # Check version in pyproject.toml (tomllib is stdlib from Python 3.11)
     pyproject_version = None
     try:
-        with open("pyproject.toml", 'r') as f:
-            content = f.read()
-            import re
-            match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                pyproject_version = match.group(1)
-    except:
+        try:
+            import tomllib
+        except ModuleNotFoundError:
+            import tomli as tomllib
+        with open("pyproject.toml", "rb") as f:
+            pyproject_version = tomllib.load(f).get("project", {}).get("version")
+    except ModuleNotFoundError:
+        print("  ⚠️  Neither tomllib nor tomli available, skipping pyproject.toml")
+    except (OSError, ValueError):
         pass
     
-    # Check version in __init__.py
+    # Check version in __init__.py without importing the package
     init_version = None
     try:
-        with open("mbvlgranger/__init__.py", 'r') as f:
-            content = f.read()
-            import re
-            match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                init_version = match.group(1)
-    except:
+        tree = ast.parse(Path("mbvlgranger/__init__.py").read_text(encoding="utf-8"))
+        for node in tree.body:
+            if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+                    and any(getattr(target, "id", None) == "__version__" for target in node.targets)):
+                init_version = node.value.value
+    except (OSError, SyntaxError):
         pass
     
     print(f"  setup.py version: {setup_version}")
@@ -75,4 +75,37 @@ def test_input_validation():
     
     # Test too short series
     with pytest.raises(ValueError):
-        analyzer.analyze_causality([1, 2], [3, 4])
\ No newline at end of file
+        analyzer.analyze_causality([1, 2], [3, 4])
+
+def test_fft_cross_correlation_matches_direct():
+    """Test FFT cross-correlation against the per-lag computation"""
+    np.random.seed(7)
+    n = 150
+    x = np.random.randn(n)
+    y = np.roll(x, 6) + 0.5 * np.random.randn(n)
+    
+    fft_result = VLGrangerCausality(use_fft=True).cross_correlation_analysis(y, x, max_lag=145)
+    direct_result = VLGrangerCausality(use_fft=False).cross_correlation_analysis(y, x, max_lag=145)
+    
+    assert fft_result[0] == direct_result[0] == 6
+    np.testing.assert_allclose(fft_result[2], direct_result[2], atol=1e-10)
+
+
+def test_fft_cross_correlation_constant_segments():
+    """Test FFT cross-correlation with zero-padded and constant stretches"""
+    np.random.seed(11)
+    n = 120
+    x = np.random.randn(n)
+    y = np.roll(x, 4) + 0.5 * np.random.randn(n)
+    x[:30] = 0.0        # Zero-padded start
+    y[-25:] = 2.5       # Constant tail
+    x[50:60] *= 1e5     # Large dynamic range
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fft_result = VLGrangerCausality(use_fft=True).cross_correlation_analysis(y, x, max_lag=100)
+        direct_result = VLGrangerCausality(use_fft=False).cross_correlation_analysis(y, x, max_lag=100)
+    
+    assert fft_result[0] == direct_result[0]
+    assert not np.isnan(fft_result[1])
+    np.testing.assert_array_equal(np.isnan(fft_result[2]), np.isnan(direct_result[2]))
+    np.testing.assert_allclose(fft_result[2], direct_result[2], atol=1e-8)
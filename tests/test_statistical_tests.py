@@ -0,0 +1,73 @@
+"""
+Tests for p-value combination in MBVL-Granger
+"""
+
+import pytest
+import numpy as np
+from mbvlgranger import mbvl_granger, mbvl_granger_combine
+from mbvlgranger.statistical_tests import combine_pvalues
+
+
+def test_combine_matches_direct_analysis():
+    """Test that re-combining band p-values matches a full run per method"""
+    rng = np.random.default_rng(1)
+    n = 600
+    x = rng.standard_normal(n)
+    y = 0.3 * rng.standard_normal(n)
+    y[7:] += 0.6 * x[:-7]
+    
+    band_analysis = mbvl_granger(x, y, fs=250, max_lag=20,
+                                 combination_method=None, noise_aware=False)
+    assert band_analysis['overall_causality'] is None
+    
+    for method in ['fisher', 'stouffer', 'bonferroni']:
+        direct = mbvl_granger(x, y, fs=250, max_lag=20,
+                              combination_method=method, noise_aware=False)
+        combined = mbvl_granger_combine(band_analysis, method)
+        
+        assert combined['combination_method'] == method
+        assert combined['combined_p_value'] == pytest.approx(direct['combined_p_value'])
+        assert combined['overall_causality'] == direct['overall_causality']
+
+
+def test_combine_pvalues_validation():
+    """Test unknown methods and empty input"""
+    with pytest.raises(ValueError):
+        combine_pvalues([0.01, 0.2], 'median')
+    
+    assert combine_pvalues([], 'fisher') == (1.0, 0.0)
+
+
+def test_combine_broadband_result():
+    """Test that broadband early-return results pass through unchanged"""
+    rng = np.random.default_rng(3)
+    n = 296
+    x = rng.standard_normal(n)
+    y = 0.2 * rng.standard_normal(n)
+    y[4:] += 0.9 * x[:-4]
+    
+    broadband = mbvl_granger(x, y, fs=250, max_lag=50)
+    assert broadband['method_used'] == 'broadband_primary'
+    
+    with pytest.warns(UserWarning):
+        combined = mbvl_granger_combine(broadband, 'stouffer')
+    assert combined['combination_method'] == 'broadband'
+    assert combined['combined_p_value'] == broadband['combined_p_value']
+
+
+def test_no_combination_skips_broadband_shortcut():
+    """Test that combination_method=None always returns band p-values"""
+    rng = np.random.default_rng(3)
+    n = 296
+    x = rng.standard_normal(n)
+    y = 0.2 * rng.standard_normal(n)
+    y[4:] += 0.9 * x[:-4]
+    
+    # Default noise_aware=True would take the broadband shortcut here
+    band_analysis = mbvl_granger(x, y, fs=250, max_lag=50, combination_method=None)
+    assert band_analysis['method_used'] == 'frequency_bands_only'
+    assert band_analysis['n_valid_bands'] > 0
+    
+    for method in ['fisher', 'stouffer', 'bonferroni']:
+        combined = mbvl_granger_combine(band_analysis, method)
+        assert combined['combination_method'] == method
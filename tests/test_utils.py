@@ -0,0 +1,34 @@
+"""
+Tests for MBVL-Granger utility functions
+"""
+
+import pytest
+import numpy as np
+from mbvlgranger.utils import lagged_linear
+
+
+def test_lagged_linear_matches_loop():
+    """Test lagged response against the per-sample definition"""
+    rng = np.random.default_rng(0)
+    n = 50
+    x = rng.standard_normal(n)
+    noise = rng.standard_normal(n)
+    
+    expected = noise.copy()
+    for t in range(5, n):
+        expected[t] += 0.8 * x[t - 5]
+    
+    y = lagged_linear(x, 5, 0.8, noise)
+    
+    np.testing.assert_allclose(y, expected)
+    # Noise input must be left untouched
+    assert not np.shares_memory(y, noise)
+
+
+def test_lagged_linear_validation():
+    """Test input validation"""
+    with pytest.raises(ValueError):
+        lagged_linear(np.zeros(5), 1, 1.0, np.zeros(4))
+    
+    with pytest.raises(ValueError):
+        lagged_linear(np.zeros(5), -1, 1.0, np.zeros(5))